@@ -1,9 +1,225 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import random
+import re
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the solver runs as plain Python
+    np = None
+    njit = None
 
 from services.csv_service import CSVService
 
+EMPLOYEE_COLUMNS = ('Employee_Name', 'Employee_EmailID')
+ASSIGNMENT_COLUMNS = ('Employee_Name', 'Employee_EmailID', 'Secret_Child_Name', 'Secret_Child_EmailID')
+
+# Finds any non-whitespace character; a value without one counts as empty
+_NON_WS = re.compile(r'\S').search
+
+
+def _build_row_validator(func_name: str, columns: Tuple[str, ...], where: str = ""):
+    """
+    Generates a validator for a fixed column layout.
+
+    The schema is known up front, so the per-column checks are emitted as
+    straight-line code: the row tuple is unpacked once and every field is
+    tested by position, with the error messages baked in.
+
+    Args:
+        func_name (str): Name of the generated function.
+        columns (Tuple[str, ...]): Column names, in the order the row tuple holds them.
+        where (str): Extra context for error messages, e.g. the file description.
+
+    Returns:
+        Callable: validator(row, i) that returns row or raises ValueError.
+    """
+    fields = [f"v{position}" for position in range(len(columns))]
+    lines = [f"def {func_name}(row, i):", f"    {', '.join(fields)}, = row"]
+    for field_name, column in zip(fields, columns):
+        message = f"'{column}' is missing or empty{where} at row "
+        lines.append(f"    if not {field_name} or not _NON_WS({field_name}):")
+        lines.append(f"        raise ValueError({message!r} + str(i) + '.')")
+    lines.append("    return row")
+
+    namespace = {'_NON_WS': _NON_WS}
+    exec(compile("\n".join(lines), f"<{func_name}>", "exec"), namespace)
+    return namespace[func_name]
+
+
+_validate_employee_row = _build_row_validator('_validate_employee_row', EMPLOYEE_COLUMNS)
+_validate_assignment_row = _build_row_validator(
+    '_validate_assignment_row', ASSIGNMENT_COLUMNS, " in last year's assignment file"
+)
+
+
+def _solve(givers, last_year_of, pool, receivers):
+    """
+    Assigns a receiver to every giver, working purely on integer ids.
+
+    Args:
+        givers: Giver ids in the order they pick.
+        last_year_of: Last year's receiver id per giver, or -1 for none.
+        pool: Shuffled receiver ids; consumed in place.
+        receivers: Output array filled with the receiver id per giver.
+
+    Returns:
+        bool: True if a valid assignment was found.
+    """
+    remaining = len(pool)
+    for step in range(len(givers)):
+        i = givers[step]
+        lyi = last_year_of[i]
+
+        # A giver forbids at most two receivers, so one of the last three
+        # pool entries is always a legal pick.
+        pick = -1
+        for k in range(remaining - 1, max(remaining - 4, -1), -1):
+            rk = pool[k]
+            if rk != i and rk != lyi:
+                pick = k
+                break
+
+        if pick >= 0:
+            receivers[i] = pool[pick]
+            remaining -= 1
+            pool[pick] = pool[remaining]
+            continue
+
+        # Dead end: every unused receiver is forbidden for this giver.
+        # Take over someone else's child and hand them the leftover one.
+        leftover = pool[remaining - 1]
+        found = False
+        for prev in range(step):
+            j = givers[prev]
+            rj = receivers[j]
+            if rj != i and rj != lyi and leftover != j and leftover != last_year_of[j]:
+                receivers[i] = rj
+                receivers[j] = leftover
+                remaining -= 1
+                found = True
+                break
+        if not found:
+            return False
+    return True
+
+
+if njit is not None:
+    _solve = njit(cache=True)(_solve)
+
+
+def _one_attempt(givers: List[int], last_year_of: List[int], seed: int) -> Optional[List[int]]:
+    """
+    Runs one greedy pass with a receiver pool shuffled from the given seed.
+
+    Returns:
+        Optional[List[int]]: The receiver id per giver, or None on a dead end.
+    """
+    n = len(givers)
+    pool = list(range(n))
+    random.Random(seed).shuffle(pool)
+    receivers = [-1] * n
+
+    args = (givers, last_year_of, pool, receivers)
+    if njit is not None:
+        args = tuple(np.array(a, dtype=np.int32) for a in args)
+    if not _solve(*args):
+        return None
+    return args[3].tolist() if njit is not None else receivers
+
+
+def _iter_bits(mask: int):
+    """
+    Yields the positions of the set bits in mask, lowest first.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _hopcroft_karp(allowed: List[int]) -> List[int]:
+    """
+    Finds a maximum matching between givers and receivers (Hopcroft-Karp).
+
+    The graph is stored as one bitmask per giver, where bit r is set if the
+    giver may get receiver r. Each BFS layer and DFS step is then a handful
+    of whole-mask AND/OR operations instead of a walk over neighbour lists,
+    and the graph takes n^2 bits rather than n^2 list slots.
+
+    Args:
+        allowed (List[int]): Bitmask of legal receiver ids per giver.
+
+    Returns:
+        List[int]: The matched receiver id per giver, or -1 if unmatched.
+    """
+    n = len(allowed)
+    pair_u = [-1] * n
+    pair_v = [-1] * n
+    free = (1 << n) - 1
+
+    while True:
+        # BFS: reach[d] holds the matched receivers leading to givers at depth d
+        frontier = [u for u in range(n) if pair_u[u] == -1]
+        reach = [0]
+        seen = 0
+        top = -1
+        while frontier:
+            hit = 0
+            for u in frontier:
+                hit |= allowed[u]
+            if hit & free:
+                top = len(reach) - 1
+                break
+            layer = hit & ~free & ~seen
+            if not layer:
+                break
+            seen |= layer
+            reach.append(layer)
+            frontier = [pair_v[v] for v in _iter_bits(layer)]
+
+        if top < 0:
+            return pair_u
+
+        # DFS: augment along the layers, iteratively to stay clear of the recursion limit
+        for root in range(n):
+            if pair_u[root] != -1:
+                continue
+
+            stack = [root]
+            via = []
+            while stack:
+                depth = len(stack) - 1
+                u = stack[-1]
+                candidates = allowed[u] & (free if depth == top else reach[depth + 1])
+
+                if not candidates:
+                    # Dead end: nobody may route through u again in this phase
+                    stack.pop()
+                    if via:
+                        reach[depth] &= ~(1 << via.pop())
+                    continue
+
+                low = candidates & -candidates
+                v = low.bit_length() - 1
+                if depth < top:
+                    stack.append(pair_v[v])
+                    via.append(v)
+                    continue
+
+                # Flip the matching along the path root -> ... -> u -> v
+                free ^= low
+                while stack:
+                    x = stack.pop()
+                    pair_u[x] = v
+                    pair_v[v] = x
+                    if via:
+                        v = via.pop()
+                        reach[len(stack)] &= ~(1 << v)
+
+
 class SecretSantaModel:
     def __init__(self, employees: List[Dict[str, Any]] = None, previous_assignments: List[Dict[str, Any]] = None):
         """
@@ -15,7 +231,8 @@ class SecretSantaModel:
         """
         self.employees = employees if employees is not None else []
         self.last_year_assignments = previous_assignments if previous_assignments is not None else []
-        self.result: List[Dict[str, Any]] = []
+        self.result: List[Tuple[str, ...]] = []
+        self._employee_cache = None
 
     def load_employees_from_csv(self, file_path: str):
         """
@@ -29,30 +246,26 @@ class SecretSantaModel:
             Exception: If file reading fails.
         """
         try:
-            data = CSVService.read_csv(file_path)
+            employees = []
+            email_to_id = {}
+            rows = CSVService.iter_columns(file_path, EMPLOYEE_COLUMNS)
+            for i, row in enumerate(rows, start=1):
+                name, email = _validate_employee_row(row, i)
+
+                if email in email_to_id:
+                    raise ValueError(f"Duplicate email found: '{email}' at row {i}.")
+                email_to_id[email] = len(employees)
+                employees.append({'Employee_Name': name, 'Employee_EmailID': email})
             
-            if not data:
+            if not employees:
                 raise ValueError("The CSV file is empty.")
 
-            if len(data) <= 2:
+            if len(employees) <= 2:
                 raise ValueError("The number of employees must be more than 2 for Secret Santa.")
-
-            seen_emails = set()
-            for i, row in enumerate(data, start=1):
-                name = row.get('Employee_Name')
-                email = row.get('Employee_EmailID')
-                
-                if not name or not name.strip():
-                    raise ValueError(f"'Employee_Name' is missing or empty at row {i}.")
                 
-                if not email or not email.strip():
-                    raise ValueError(f"'Employee_EmailID' is missing or empty at row {i}.")
-                
-                if email in seen_emails:
-                    raise ValueError(f"Duplicate email found: '{email}' at row {i}.")
-                seen_emails.add(email)
-                
-            self.employees = data
+            self.employees = employees
+            # Seed the cache with the map built while checking for duplicates
+            self._employee_cache = (list(email_to_id), email_to_id)
 
         except Exception as e:
             raise e
@@ -70,41 +283,59 @@ class SecretSantaModel:
             Exception: If file reading fails.
         """
         try:
-            data = CSVService.read_csv(file_path)
-            
-            if not data:
+            assignments = []
+            rows = CSVService.iter_columns(file_path, ASSIGNMENT_COLUMNS)
+            for i, row in enumerate(rows, start=1):
+                _validate_assignment_row(row, i)
+                assignments.append(dict(zip(ASSIGNMENT_COLUMNS, row)))
+
+            if not assignments:
                 print("Warning: Last year's assignment file is empty.")
-                self.last_year_assignments = []
                 # It's okay if last year's data is empty, just warn and continue
-                return
-
-            for i, row in enumerate(data, start=1):
-                emp_name = row.get('Employee_Name')
-                emp_email = row.get('Employee_EmailID')
-                child_name = row.get('Secret_Child_Name')
-                child_email = row.get('Secret_Child_EmailID')
-                
-                if not emp_name or not emp_name.strip():
-                    raise ValueError(f"'Employee_Name' is missing or empty in last year's assignment file at row {i}.")
-                
-                if not emp_email or not emp_email.strip():
-                    raise ValueError(f"'Employee_EmailID' is missing or empty in last year's assignment file at row {i}.")
-
-                if not child_name or not child_name.strip():
-                    raise ValueError(f"'Secret_Child_Name' is missing or empty in last year's assignment file at row {i}.")
-
-                if not child_email or not child_email.strip():
-                    raise ValueError(f"'Secret_Child_EmailID' is missing or empty in last year's assignment file at row {i}.")
                 
-            self.last_year_assignments = data
+            self.last_year_assignments = assignments
 
         except Exception as e:
             raise e
 
+    def _participant_ids(self):
+        """
+        Returns the emails, email -> id map and last year's child id per giver.
+
+        The email -> id map only depends on the employee emails, so it is
+        cached and reused while the emails are unchanged. last_year_of is
+        rebuilt on every call, since last year's rows can change in place.
+        """
+        # Working with emails as unique identifiers, mapped to integer ids.
+        # After a CSV load the cache already holds the loader's map.
+        names = [e['Employee_EmailID'] for e in self.employees]
+        cache = self._employee_cache
+        if cache is not None and cache[0] == names:
+            email_to_id = cache[1]
+        else:
+            email_to_id = {email: i for i, email in enumerate(names)}
+            self._employee_cache = (names, email_to_id)
+        
+        # Build last year map: email -> email
+        last_year = {}
+        for row in self.last_year_assignments:
+            giver = row.get('Employee_EmailID')
+            child = row.get('Secret_Child_EmailID')
+            if giver and child:
+                last_year[giver] = child
+
+        # Precompute last year's child id per giver once (-1 for none), with the
+        # bound get methods hoisted out of the comprehension
+        last_year_get = last_year.get
+        id_get = email_to_id.get
+        last_year_of = [id_get(last_year_get(nm), -1) for nm in names]
+
+        return names, email_to_id, last_year_of
+
     def generate_assignments(self):
         """
         Generates Secret Santa assignments based on the provided logic.
-        Stores the result in self.result.
+        Stores the result in self.result as tuples in ASSIGNMENT_COLUMNS order.
         
         Raises:
             ValueError: If there are not enough participants.
@@ -115,84 +346,72 @@ class SecretSantaModel:
         if n < 2:
             raise ValueError("Need at least 2 participants") 
         
-        # Map email to employee dict for easy lookup
-        email_to_emp = {e['Employee_EmailID']: e for e in employees}
-        
-        # Working with emails as unique identifiers
-        names = [e['Employee_EmailID'] for e in employees]
-        
-        # Build last year map: email -> email
-        last_year = {}
-        for row in self.last_year_assignments:
-            giver = row.get('Employee_EmailID')
-            child = row.get('Secret_Child_EmailID')
-            if giver and child:
-                last_year[giver] = child
-                
-        receivers = names[:]
-        receivers = names[:]
-        
-        # Retry logic: Try to find a valid permutation multiple times
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            random.shuffle(receivers)
-            
-            # Step 1: Remove self-assignments (Greedy Swaps)
-            for i in range(n):
-                if names[i] == receivers[i]:
-                    j = (i + 1) % n
-                    receivers[i], receivers[j] = receivers[j], receivers[i]
-
-            # Step 2: Fix last-year repeats (Greedy Swaps)
-            valid_assignment = True
-            for i in range(n):
-                if last_year.get(names[i]) == receivers[i]:
-                    # Need to swap with someone else, j
-                    possible_swap_found = False
-                    for j in range(n):
-                        if (
-                            names[j] != receivers[j] and           # j is not self-assigned
-                            receivers[j] != names[i] and           # j's current receiver for i is okay (checks self-assignment for i)
-                            receivers[i] != names[j] and           # i's current receiver for j is okay (checks self-assignment for j)
-                            last_year.get(names[j]) != receivers[i] and # i's current receiver for j is okay (checks last year for j)
-                            last_year.get(names[i]) != receivers[j]     # j's current receiver for i is okay (checks last year for i)
-                        ):
-                            receivers[i], receivers[j] = receivers[j], receivers[i]
-                            possible_swap_found = True
-                            break
-                    if not possible_swap_found:
-                        valid_assignment = False
-                        break
-            
-            # Additional Check: Ensure absolutely no constraints are violated after swaps
-            if valid_assignment:
-                final_check_pass = True
-                for i in range(n):
-                    if names[i] == receivers[i]:
-                        final_check_pass = False
-                        break
-                    if last_year.get(names[i]) == receivers[i]:
-                        final_check_pass = False
-                        break
-                
-                if final_check_pass:
-                    # Build result and return
-                    self.result = []
-                    for giver_email, child_email in zip(names, receivers):
-                        giver_data = email_to_emp[giver_email]
-                        child_data = email_to_emp[child_email]
-                        
-                        self.result.append({
-                            'Employee_Name': giver_data['Employee_Name'],
-                            'Employee_EmailID': giver_data['Employee_EmailID'],
-                            'Secret_Child_Name': child_data['Employee_Name'],
-                            'Secret_Child_EmailID': child_data['Employee_EmailID']
-                        })
-                    return
-
-        # If loop completes without return
-        raise RuntimeError("No valid Secret Santa assignment exists after multiple attempts.")
-        
+        names, email_to_id, last_year_of = self._participant_ids()
+
+        # Fail fast if someone has no legal secret child, or nobody may give to them
+        santas_for = [n - 1] * n
+        for g in range(n):
+            previous = last_year_of[g]
+            if previous >= 0 and previous != g:
+                if n == 2:
+                    raise RuntimeError(f"No valid Secret Santa assignment exists: '{names[g]}' has no legal secret child.")
+                santas_for[previous] -= 1
+        for r in range(n):
+            if santas_for[r] == 0:
+                raise RuntimeError(f"No valid Secret Santa assignment exists: nobody can be the Secret Santa of '{names[r]}'.")
+
+        # Private generator, seeded from os.urandom, instead of the shared module one
+        rng = random.Random()
+        shuffle = rng.shuffle
+
+        # Most constrained givers pick first (shuffle first so ties stay random)
+        givers = list(range(n))
+        shuffle(givers)
+        givers.sort(key=lambda g: last_year_of[g] >= 0, reverse=True)
+
+        receivers = _one_attempt(givers, last_year_of, rng.getrandbits(64))
+
+        if receivers is None:
+            # The greedy pass can dead-end on tightly constrained rosters; an
+            # exact matching finds an assignment whenever one exists.
+            # Receivers are relabelled in random order so the matching stays random.
+            order = list(range(n))
+            shuffle(order)
+            label = [0] * n
+            for position, r in enumerate(order):
+                label[r] = position
+
+            everyone = (1 << n) - 1
+            allowed = []
+            for g in range(n):
+                mask = everyone & ~(1 << label[g])
+                if last_year_of[g] >= 0:
+                    mask &= ~(1 << label[last_year_of[g]])
+                allowed.append(mask)
+
+            matched = _hopcroft_karp(allowed)
+            if -1 in matched:
+                raise RuntimeError("No valid Secret Santa assignment exists for the given constraints.")
+            receivers = [order[position] for position in matched]
+
+        # Build result in the original employee order
+        self.result = []
+        for giver_data, child_id in zip(employees, receivers):
+            child_data = employees[child_id]
+
+            self.result.append((
+                giver_data['Employee_Name'],
+                giver_data['Employee_EmailID'],
+                child_data['Employee_Name'],
+                child_data['Employee_EmailID']
+            ))
+
+    def result_as_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Returns the generated assignments as dictionaries keyed by column name.
+        Kept for callers that relied on self.result holding dictionaries.
+        """
+        return [dict(zip(ASSIGNMENT_COLUMNS, row)) for row in self.result]
 
     def run(self):
         """
@@ -216,13 +435,11 @@ class SecretSantaModel:
 
             # 4. Save Results
             output_file = input("Enter the path to save the result CSV file (default: secret_santa_result.csv): ").strip()
-            if not output_file:
-                output_file = "secret_santa_result.csv"
             if not output_file:
                 output_file = "secret_santa_result.csv"
             # Removed raw print(self.result) for better UX
             
-            CSVService.write_csv(output_file, self.result)
+            CSVService.write_rows(output_file, ASSIGNMENT_COLUMNS, self.result)
             print(f"Results successfully saved to {output_file}")
 
         except Exception as e:
@@ -1,6 +1,43 @@
 import csv
 import os
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    # pyarrow is optional; without it every file is read with the csv module
+    pa = None
+    pa_csv = None
+
+# Files at least this large are parsed with pyarrow when available
+ARROW_MIN_BYTES = 1 << 20
+
+
+def _tuple_getter(keys: Sequence[Any]) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Returns a callable that picks the given keys/indices from a row as a tuple.
+    """
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
+
+
+def _open_csv(file_path: str):
+    """
+    Opens a CSV file for reading with a 1 MiB buffer.
+
+    Relies on open() failing instead of checking os.path.exists() first,
+    which saves a stat call per file.
+    """
+    try:
+        return open(file_path, mode='r', newline='', encoding='utf-8', buffering=1 << 20)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The file '{file_path}' was not found.") from None
+    except OSError as e:
+        raise Exception("Failed to read CSV file")
 
 class CSVService:
     """
@@ -8,30 +45,115 @@ class CSVService:
     """
 
     @staticmethod
-    def read_csv(file_path: str) -> List[Dict[str, Any]]:
+    def iter_csv(file_path: str) -> Iterator[Dict[str, Any]]:
         """
-        Reads a CSV file and returns its content as a list of dictionaries.
+        Reads a CSV file lazily, yielding one row at a time as a dictionary.
 
         Args:
             file_path (str): The absolute or relative path to the CSV file.
 
-        Returns:
-            List[Dict[str, Any]]: A list of rows, where each row is a dictionary.
+        Yields:
+            Dict[str, Any]: The next row of the file.
 
         Raises:
             FileNotFoundError: If the file does not exist.
             Exception: If an error occurs during the read operation.
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"The file '{{file_path}}' was not found.")
+        csvfile = _open_csv(file_path)
 
         try:
-            with open(file_path, mode='r', newline='', encoding='utf-8') as csvfile:
+            with csvfile:
                 reader = csv.DictReader(csvfile)
-                return list(reader)
+                yield from reader
         except Exception as e:
             raise Exception("Failed to read CSV file")
 
+    @staticmethod
+    def iter_columns(file_path: str, columns: Sequence[str]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Reads selected columns of a CSV file lazily, yielding one tuple per row.
+
+        The header is mapped to column positions once, so rows are parsed with
+        csv.reader and indexed directly instead of building a dict per row.
+        Missing columns and short rows yield None for the affected values.
+        Files of ARROW_MIN_BYTES or more are parsed by pyarrow's C parser
+        when it is installed; files with short or long rows fall back to
+        csv.reader so they behave the same as small files.
+
+        Args:
+            file_path (str): The absolute or relative path to the CSV file.
+            columns (Sequence[str]): Column names to extract, in output order.
+
+        Yields:
+            Tuple[Any, ...]: The values of the requested columns for the next row.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: If an error occurs during the read operation.
+        """
+        csvfile = _open_csv(file_path)
+
+        try:
+            with csvfile:
+                if pa_csv is not None and os.fstat(csvfile.fileno()).st_size >= ARROW_MIN_BYTES:
+                    try:
+                        table = pa_csv.read_csv(
+                            csvfile.buffer,
+                            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                            convert_options=pa_csv.ConvertOptions(
+                                column_types={name: pa.string() for name in columns},
+                                include_columns=list(columns),
+                                include_missing_columns=True,
+                            ),
+                        )
+                    except pa.ArrowInvalid:
+                        # Ragged rows: nothing has been yielded yet, so rewind and let
+                        # csv.reader pad them, keeping the row-level validation errors
+                        csvfile.seek(0)
+                    else:
+                        yield from zip(*(table.column(name).to_pylist() for name in columns))
+                        return
+
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if header is None:
+                    return
+
+                # Missing columns point at a sentinel slot just past the header,
+                # which always holds None; fields beyond the header are never read
+                width = len(header)
+                index = {name: i for i, name in enumerate(header)}
+                positions = [index.get(name, width) for name in columns]
+                sentinel = width in positions
+                pick = _tuple_getter(positions)
+
+                for row in reader:
+                    if not row:
+                        continue
+                    if sentinel or len(row) < width:
+                        del row[width:]
+                        row.extend([None] * (width + 1 - len(row)))
+                    yield pick(row)
+        except Exception as e:
+            raise Exception("Failed to read CSV file")
+
+    @staticmethod
+    def read_csv(file_path: str) -> List[Dict[str, Any]]:
+        """
+        Reads a CSV file and returns its content as a list of dictionaries.
+
+        Args:
+            file_path (str): The absolute or relative path to the CSV file.
+
+        Returns:
+            List[Dict[str, Any]]: A list of rows, where each row is a dictionary.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: If an error occurs during the read operation.
+        """
+        return list(CSVService.iter_csv(file_path))
+
     @staticmethod
     def write_csv(file_path: str, data: List[Dict[str, Any]]) -> None:
         """
@@ -58,3 +180,28 @@ class CSVService:
                 writer.writerows(data)
         except Exception as e:
             raise Exception("Failed to write CSV file")
+
+    @staticmethod
+    def write_rows(file_path: str, header: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Writes pre-serialized rows to a CSV file in a single buffered pass.
+
+        Args:
+            file_path (str): The destination path for the CSV file.
+            header (Sequence[str]): Column names, written as the first line.
+            rows (Sequence[Sequence[Any]]): Rows whose values are already in header order.
+
+        Raises:
+            ValueError: If there are no rows to write.
+            Exception: If an error occurs during the write operation.
+        """
+        if not rows:
+            raise ValueError("Data list is empty. Cannot write empty CSV with no rows.")
+
+        try:
+            with open(file_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(header)
+                writer.writerows(rows)
+        except Exception as e:
+            raise Exception("Failed to write CSV file")